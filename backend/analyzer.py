@@ -0,0 +1,419 @@
+"""Advanced analysis layer: board texture, draws, ranges and action advice."""
+
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .engine import evaluate_best_hand, estimate_win_probability
+from .fast_equity import encode_cards
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+_TEXTURES = ('dry', 'semi-wet', 'wet')
+
+# shared pool for overlapping independent sub-analyses within one request
+_subtask_executor = ThreadPoolExecutor(max_workers=4)
+
+
+@dataclass
+class OpponentProfile:
+    """Observed frequencies for a single opponent, all in [0, 1]."""
+    vpip: float = 0.25
+    pfr: float = 0.15
+    aggression: float = 0.5
+    fold_to_cbet: float = 0.5
+    went_to_showdown: float = 0.25
+
+    def pack(self) -> int:
+        """Quantize the profile into one int, a percentage point per byte.
+
+        Byte order matches the field order above (vpip in the low byte).
+        Classifiers compare against the packed form with shifts and masks,
+        and the int doubles as a compact, hashable cache key.
+        """
+        packed = 0
+        for shift, value in enumerate((self.vpip, self.pfr, self.aggression,
+                                       self.fold_to_cbet, self.went_to_showdown)):
+            quantized = min(max(int(round(value * 100)), 0), 100)
+            packed |= quantized << (8 * shift)
+        return packed
+
+
+@dataclass(slots=True)
+class ComprehensiveAnalysis:
+    """Result of one full decision analysis.
+
+    A slotted dataclass rather than a hand-built dict: orjson serializes
+    it field-by-field without an intermediate copy, and the field list is
+    the single source of truth for the response shape.
+    """
+    hand_type: str
+    hand_score: int
+    equity: float
+    adjusted_equity: float
+    board_texture: str
+    draws: Dict[str, bool]
+    pot_odds: float
+    action: str
+    bet_fraction: float
+    breakdown: Dict
+
+
+@dataclass
+class BoardFacts:
+    """Everything the analyzers derive from the community cards, built once."""
+    texture: str
+    flush_draw: bool
+    straight_draw: bool
+    paired: bool
+
+
+@njit(cache=True)
+def _board_facts_kernel(cards: np.ndarray) -> Tuple[int, int]:
+    """One pass over packed uint8 card codes producing texture and draw flags.
+
+    Cards use the engine-wide ``rank << 2 | suit`` encoding.  Texture is
+    0=dry, 1=semi-wet, 2=wet; draw flags are 1=flush draw,
+    2=open straight draw, 4=paired board.
+    """
+    rank_hist = np.bincount(cards >> 2, minlength=13)
+    suit_hist = np.bincount(cards & 3, minlength=4)
+    max_suit = suit_hist.max()
+    max_rank = rank_hist.max()
+
+    wetness = 0
+    if max_suit >= 3:
+        wetness += 2
+    elif max_suit == 2:
+        wetness += 1
+    if max_rank >= 2:
+        wetness += 1
+    # connectivity: any three ranks within a five-rank window
+    for low in range(9):
+        in_window = 0
+        for r in range(low, low + 5):
+            if rank_hist[r] > 0:
+                in_window += 1
+        if in_window >= 3:
+            wetness += 1
+            break
+    if wetness >= 3:
+        texture = 2
+    elif wetness >= 1:
+        texture = 1
+    else:
+        texture = 0
+
+    flags = 0
+    if 2 <= max_suit < 5:
+        flags |= 1
+    for low in range(10):
+        if rank_hist[low] > 0 and rank_hist[low + 1] > 0 and rank_hist[low + 2] > 0:
+            flags |= 2
+            break
+    if max_rank >= 2:
+        flags |= 4
+    return texture, flags
+
+
+@lru_cache(maxsize=4096)
+def _board_facts_cached(community_tuple: Tuple[str, ...]) -> Tuple[int, int]:
+    return _board_facts_kernel(encode_cards(list(community_tuple)))
+
+
+def _parse_board(community_cards: List[str]) -> BoardFacts:
+    """Derive all board facts in a single fused, cached pass."""
+    if not community_cards:
+        return BoardFacts('preflop', False, False, False)
+    texture, flags = _board_facts_cached(tuple(sorted(community_cards)))
+    return BoardFacts(_TEXTURES[texture],
+                      bool(flags & 1), bool(flags & 2), bool(flags & 4))
+
+
+def _analyze_board_texture(community_cards: List[str]) -> str:
+    return _parse_board(community_cards).texture
+
+
+def _analyze_draw_potential(community_cards: List[str]) -> Dict[str, bool]:
+    facts = _parse_board(community_cards)
+    return {
+        'flush_draw': facts.flush_draw,
+        'straight_draw': facts.straight_draw,
+        'paired': facts.paired,
+    }
+
+
+class LFUCache:
+    """Small least-frequently-used cache with a hard size bound.
+
+    Eviction scans for the coldest entry, which is O(n) but only runs once
+    the cache is full; lookups and hot-path hits stay O(1).
+    """
+
+    def __init__(self, maxsize: int = 32768):
+        self.maxsize = maxsize
+        self._data = {}
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key, default=None):
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        entry[1] += 1
+        return entry[0]
+
+    def put(self, key, value) -> None:
+        entry = self._data.get(key)
+        if entry is not None:
+            entry[0] = value
+            return
+        if len(self._data) >= self.maxsize:
+            coldest = min(self._data, key=lambda k: self._data[k][1])
+            del self._data[coldest]
+        self._data[key] = [value, 1]
+
+
+# canonical position names plus the aliases clients actually send; one
+# dict .get replaces per-request lower()/membership probing and guarantees
+# downstream caches only ever see the six canonical keys
+_POSITION_ALIASES = {
+    'early': 'early', 'utg': 'early', 'utg+1': 'early', 'ep': 'early',
+    'middle': 'middle', 'mp': 'middle', 'hijack': 'middle', 'hj': 'middle',
+    'cutoff': 'cutoff', 'co': 'cutoff',
+    'button': 'button', 'btn': 'button', 'dealer': 'button',
+    'small_blind': 'small_blind', 'sb': 'small_blind',
+    'big_blind': 'big_blind', 'bb': 'big_blind',
+}
+
+
+def _normalize_position(position: str) -> str:
+    return _POSITION_ALIASES.get(position.lower(), 'middle')
+
+
+def _vpip_bucket(vpip: float) -> int:
+    """Bucket VPIP into tight (0), standard (1) or loose (2)."""
+    if vpip < 0.15:
+        return 0
+    if vpip > 0.3:
+        return 2
+    return 1
+
+
+@lru_cache(maxsize=None)
+def _our_range_cached(position: str) -> Tuple[str, ...]:
+    if position in ('button', 'cutoff'):
+        return ('22+', 'A2s+', 'A8o+', 'K9s+', 'KTo+', 'QTs+', 'JTs', 'T9s')
+    if position in ('small_blind', 'big_blind'):
+        return ('22+', 'A2s+', 'A5o+', 'K5s+', 'K9o+', 'Q8s+', 'J8s+', '76s+')
+    return ('55+', 'A9s+', 'ATo+', 'KJs+', 'KQo', 'QJs')
+
+
+@lru_cache(maxsize=None)
+def _opponent_range_cached(vpip_bucket: int) -> Tuple[str, ...]:
+    if vpip_bucket == 0:
+        return ('88+', 'AJs+', 'AQo+', 'KQs')
+    if vpip_bucket == 2:
+        return ('22+', 'A2s+', 'A2o+', 'K2s+', 'K8o+', 'Q5s+', 'J7s+', '54s+')
+    return ('44+', 'A7s+', 'A9o+', 'KTs+', 'KJo+', 'QTs+', 'JTs', '98s')
+
+
+@lru_cache(maxsize=4096)
+def _classify_packed_style(packed: int) -> str:
+    """Classify a packed profile with shift/mask compares on native ints."""
+    tight = packed & 0xFF < 22
+    passive = (packed >> 16) & 0xFF < 40
+    if tight:
+        return 'tight-passive' if passive else 'tight-aggressive'
+    return 'loose-passive' if passive else 'loose-aggressive'
+
+
+# Action selection: equity is bucketed by bisect into _EQUITY_THRESHOLDS
+# and the bucket index picks its handler from a flat dispatch table,
+# replacing the old if/elif cascade with one sorted lookup.
+_EQUITY_THRESHOLDS = (0.25, 0.4, 0.55, 0.7)
+
+
+def _action_weak(equity, pot_odds, profile):
+    return ('fold', 0.0) if pot_odds > equity else ('check', 0.0)
+
+
+def _action_marginal(equity, pot_odds, profile):
+    return ('call', 0.0) if equity > pot_odds else ('fold', 0.0)
+
+
+def _action_medium(equity, pot_odds, profile):
+    if profile.fold_to_cbet > 0.6:
+        return ('bet', 0.5)
+    return ('call', 0.0)
+
+
+def _action_strong(equity, pot_odds, profile):
+    return ('bet', 0.66)
+
+
+def _action_premium(equity, pot_odds, profile):
+    return ('raise', 1.0)
+
+
+_ACTION_DISPATCH = (_action_weak, _action_marginal, _action_medium,
+                    _action_strong, _action_premium)
+
+
+# SPR adjustment as a bucketed table: index min(int(spr), 19) yields
+# (low-equity adjustment, high-equity adjustment, equity threshold), and
+# the pick between low/high is a bool multiply instead of a branch.
+def _build_spr_table() -> Tuple[Tuple[float, float, float], ...]:
+    rows = []
+    for bucket in range(20):
+        if bucket < 3:
+            rows.append((-0.02, 0.02, 0.5))
+        elif bucket < 8:
+            rows.append((0.0, 0.0, 0.5))
+        else:
+            rows.append((-0.01, 0.01, 0.4))
+    return tuple(rows)
+
+
+_SPR_ADJ_TABLE = _build_spr_table()
+
+_POSITION_ADJ = {'button': 0.02, 'cutoff': 0.02,
+                 'small_blind': -0.02, 'big_blind': -0.02}
+
+
+class AdvancedEquityCalculator:
+    """Adjusts raw equity for position, stack depth and opponent tendencies."""
+
+    def calculate_adjusted_equity(self, raw_equity: float, profile: OpponentProfile,
+                                  position: str, spr: float) -> float:
+        # one fused expression: SPR table row, linear profile terms and the
+        # position offset, with no helper dispatch in between
+        low, high, threshold = _SPR_ADJ_TABLE[min(int(spr), 19)]
+        adjusted = (raw_equity
+                    + low + (high - low) * (raw_equity >= threshold)
+                    + 0.03 * (profile.fold_to_cbet - 0.5)
+                    - 0.02 * (profile.aggression - 0.5)
+                    + _POSITION_ADJ.get(position, 0.0))
+        return min(max(adjusted, 0.0), 1.0)
+
+
+class AdvancedPokerEngine:
+    """Comprehensive single-decision analysis built on the core engine."""
+
+    def __init__(self):
+        self.equity_cache = LFUCache(maxsize=100_000)
+        self.range_cache = LFUCache(maxsize=10_000)
+        self.equity_calculator = AdvancedEquityCalculator()
+
+    def analyze_comprehensive(self, hole_cards: List[str], community_cards: List[str], *,
+                              position: str = 'middle',
+                              opponent_profile: Optional[OpponentProfile] = None,
+                              pot: float = 0.0, to_call: float = 0.0,
+                              stack: float = 100.0,
+                              num_opponents: int = 1) -> ComprehensiveAnalysis:
+        profile = opponent_profile or OpponentProfile()
+        position = _normalize_position(position)
+
+        # the equity simulation and the treys evaluation are independent;
+        # overlap them (NumPy releases the GIL inside the batch kernels)
+        equity_future = _subtask_executor.submit(
+            self._calculate_raw_equity, hole_cards, community_cards, num_opponents)
+        if community_cards:
+            hand_type, hand_score = evaluate_best_hand(hole_cards, community_cards)
+        else:
+            hand_type, hand_score = 'Preflop', 0
+        equity = equity_future.result()
+        spr = stack / pot if pot > 0 else 20.0
+        adjusted_equity = self.equity_calculator.calculate_adjusted_equity(
+            equity, profile, position, spr)
+
+        pot_odds = to_call / (pot + to_call) if to_call > 0 else 0.0
+        action, bet_fraction = self._determine_optimal_action(
+            adjusted_equity, pot_odds, profile)
+
+        board_facts = _parse_board(community_cards)
+        our_range = self._estimate_our_range(position)
+        opponent_range = self._estimate_opponent_range(profile)
+        return ComprehensiveAnalysis(
+            hand_type=hand_type,
+            hand_score=hand_score,
+            equity=equity,
+            adjusted_equity=adjusted_equity,
+            board_texture=board_facts.texture,
+            draws={
+                'flush_draw': board_facts.flush_draw,
+                'straight_draw': board_facts.straight_draw,
+                'paired': board_facts.paired,
+            },
+            pot_odds=pot_odds,
+            action=action,
+            bet_fraction=bet_fraction,
+            breakdown=self._create_detailed_breakdown(
+                hole_cards, community_cards, position, profile,
+                board_facts=board_facts,
+                our_range=our_range, opponent_range=opponent_range),
+        )
+
+    def _calculate_raw_equity(self, hole_cards: List[str], community_cards: List[str],
+                              num_opponents: int, trials: int = 10000) -> float:
+        # sorting canonicalizes card order so permuted inputs share a slot
+        key = (tuple(sorted(hole_cards)), tuple(sorted(community_cards)), num_opponents)
+        cached = self.equity_cache.get(key)
+        if cached is not None:
+            return cached
+        win, tie, _ = estimate_win_probability(
+            hole_cards, community_cards,
+            num_opponents=num_opponents, trials=trials)
+        equity = win + 0.5 * tie
+        self.equity_cache.put(key, equity)
+        return equity
+
+    def _estimate_our_range(self, position: str) -> Tuple[str, ...]:
+        return _our_range_cached(position)
+
+    def _estimate_opponent_range(self, profile: OpponentProfile) -> Tuple[str, ...]:
+        return _opponent_range_cached(_vpip_bucket(profile.vpip))
+
+    def _determine_optimal_action(self, equity: float, pot_odds: float,
+                                  profile: OpponentProfile):
+        bucket = bisect_right(_EQUITY_THRESHOLDS, equity)
+        return _ACTION_DISPATCH[bucket](equity, pot_odds, profile)
+
+    def _classify_playing_style(self, profile: OpponentProfile) -> str:
+        return _classify_packed_style(profile.pack())
+
+    def _create_detailed_breakdown(self, hole_cards: List[str],
+                                   community_cards: List[str], position: str,
+                                   profile: OpponentProfile, *,
+                                   board_facts: Optional[BoardFacts] = None,
+                                   our_range: Optional[Tuple[str, ...]] = None,
+                                   opponent_range: Optional[Tuple[str, ...]] = None) -> Dict:
+        if board_facts is None:
+            board_facts = _parse_board(community_cards)
+        if our_range is None:
+            our_range = self._estimate_our_range(position)
+        if opponent_range is None:
+            opponent_range = self._estimate_opponent_range(profile)
+        return {
+            'our_range': our_range,
+            'opponent_range': opponent_range,
+            'opponent_style': self._classify_playing_style(profile),
+            'opponent_profile': vars(profile),
+            'board_texture': board_facts.texture,
+            'draws': {
+                'flush_draw': board_facts.flush_draw,
+                'straight_draw': board_facts.straight_draw,
+                'paired': board_facts.paired,
+            },
+        }
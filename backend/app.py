@@ -1,22 +1,143 @@
-from flask import Flask, request, jsonify
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import os
+import time
+import uuid
+
+import orjson
+from flask import Flask, request
+from werkzeug.exceptions import BadRequest
 from .engine import evaluate_best_hand, estimate_win_probability
+from .analyzer import AdvancedPokerEngine, OpponentProfile
 
 app = Flask(__name__)
+advanced_engine = AdvancedPokerEngine()
+
+# background jobs for the heavy analysis endpoints; entries are
+# (future, expiry) and abandoned jobs are pruned on submit so the dict
+# stays bounded even when results are never collected
+_job_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+_jobs = {}
+_JOB_TTL = 600.0
+_MAX_JOBS = 1000
+
+
+def _prune_jobs():
+    """Drop expired jobs, then the oldest beyond the size bound."""
+    now = time.monotonic()
+    for job_id in [j for j, (_, expiry) in _jobs.items() if expiry <= now]:
+        del _jobs[job_id]
+    while len(_jobs) > _MAX_JOBS:
+        del _jobs[next(iter(_jobs))]
+
+
+def ojsonify(data):
+    """jsonify replacement serializing through orjson straight to bytes."""
+    return app.response_class(
+        orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY),
+        mimetype='application/json')
+
+
+def _payload() -> dict:
+    """Parse the request body with orjson.
+
+    Empty, malformed and non-object bodies abort with a 400, matching
+    what ``request.get_json(force=True)`` did before orjson took over.
+    """
+    raw = request.get_data(cache=False)
+    if not raw:
+        raise BadRequest('empty JSON body')
+    try:
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        raise BadRequest('invalid JSON body')
+    if not isinstance(data, dict):
+        raise BadRequest('JSON body must be an object')
+    return data
+
+
+_VALID_CARDS = frozenset(r + s for r in '23456789TJQKA' for s in 'shdc')
+
+
+def _bad_cards(*card_lists):
+    """Cards not in the 52-card deck notation, or None if all are valid.
+
+    One set-membership pass per card, so malformed requests are rejected
+    before any parsing or simulation work starts instead of surfacing as
+    a 500 from deep inside the evaluator.
+    """
+    bad = [c for cards in card_lists for c in cards
+           if not isinstance(c, str) or c not in _VALID_CARDS]
+    return bad or None
+
+
+def _shape_error(hole, community):
+    """Hand-shape problem as a message, or None if well-formed.
+
+    Notation checks alone let a one-card hole 500 deep in the kernel
+    and a three-card hole return a silently wrong answer, so the shape
+    is pinned here: exactly two hole cards, at most five on board, and
+    no card dealt twice.
+    """
+    if not isinstance(hole, list) or len(hole) != 2:
+        return 'exactly two hole cards required'
+    if not isinstance(community, list) or len(community) > 5:
+        return 'at most five community cards allowed'
+    cards = hole + community
+    # non-string entries are left for the notation check to report
+    if (all(isinstance(c, str) for c in cards)
+            and len(set(cards)) != len(cards)):
+        return 'duplicate cards'
+    return None
+
+
+def _reject_cards(hole, community):
+    """400 response for malformed card input, or None when it is clean."""
+    error = _shape_error(hole, community)
+    if error:
+        return ojsonify({'error': error}), 400
+    bad = _bad_cards(hole, community)
+    if bad:
+        return ojsonify({'error': 'invalid cards', 'cards': bad}), 400
+    return None
+
+
+@dataclass(slots=True)
+class AnalyzeRequest:
+    """Typed /analyze payload, parsed once from the raw request body."""
+    hole: list
+    community: list
+    opponents: int = 1
+    trials: int = 1000
+    precision: float = 0.01
+    seed: int = None
+
+    @classmethod
+    def from_request(cls) -> 'AnalyzeRequest':
+        data = _payload()
+        return cls(hole=data.get('hole', []),
+                   community=data.get('community', []),
+                   opponents=int(data.get('opponents', 1)),
+                   trials=int(data.get('trials', 1000)),
+                   precision=float(data.get('precision', 0.01)),
+                   seed=data.get('seed'))
 
 
 @app.route('/analyze', methods=['POST'])
 def analyze():
-    data = request.get_json(force=True)
-    hole = data.get('hole', [])
-    community = data.get('community', [])
-    opponents = int(data.get('opponents', 1))
-    trials = int(data.get('trials', 1000))
-
-    hand_type, _ = evaluate_best_hand(hole, community)
-    win, tie, loss = estimate_win_probability(hole, community,
-                                              num_opponents=opponents,
-                                              trials=trials)
-    return jsonify({
+    req = AnalyzeRequest.from_request()
+    reject = _reject_cards(req.hole, req.community)
+    if reject:
+        return reject
+
+    hand_type, _ = (evaluate_best_hand(req.hole, req.community)
+                    if req.community else ('Preflop', 0))
+    win, tie, loss = estimate_win_probability(req.hole, req.community,
+                                              num_opponents=req.opponents,
+                                              trials=req.trials,
+                                              precision=req.precision,
+                                              seed=req.seed)
+    return ojsonify({
         'hand_type': hand_type,
         'win_prob': win,
         'tie_prob': tie,
@@ -24,5 +145,100 @@ def analyze():
     })
 
 
+@app.route('/analyze/batch', methods=['POST'])
+def analyze_batch():
+    """Analyze many scenarios in one request, amortizing per-call setup.
+
+    Accepts {"scenarios": [{...same fields as /analyze...}, ...]} and
+    returns results in the same order.  A UI scrubbing through board
+    run-outs can resolve a whole sweep in a single round trip, and
+    repeated hole/board combinations hit the shared equity caches.
+    """
+    data = _payload()
+    results = []
+    for scenario in data.get('scenarios', []):
+        hole = scenario.get('hole', [])
+        community = scenario.get('community', [])
+        reject = _reject_cards(hole, community)
+        if reject:
+            return reject
+        opponents = int(scenario.get('opponents', 1))
+        trials = int(scenario.get('trials', 1000))
+        hand_type, _ = evaluate_best_hand(hole, community) if community else ('Preflop', 0)
+        win, tie, loss = estimate_win_probability(hole, community,
+                                                  num_opponents=opponents,
+                                                  trials=trials)
+        results.append({
+            'hand_type': hand_type,
+            'win_prob': win,
+            'tie_prob': tie,
+            'loss_prob': loss
+        })
+    return ojsonify({'results': results})
+
+
+def _run_advanced(data):
+    profile = OpponentProfile(**data.get('opponent_profile', {}))
+    return advanced_engine.analyze_comprehensive(
+        data.get('hole', []),
+        data.get('community', []),
+        position=data.get('position', 'middle'),
+        opponent_profile=profile,
+        pot=float(data.get('pot', 0.0)),
+        to_call=float(data.get('to_call', 0.0)),
+        stack=float(data.get('stack', 100.0)),
+        num_opponents=int(data.get('opponents', 1)))
+
+
+@app.route('/analyze/advanced', methods=['POST'])
+def analyze_advanced():
+    data = _payload()
+    reject = _reject_cards(data.get('hole', []), data.get('community', []))
+    if reject:
+        return reject
+    return ojsonify(_run_advanced(data))
+
+
+@app.route('/analyze/advanced/submit', methods=['POST'])
+def analyze_advanced_submit():
+    """Queue a heavy analysis and return immediately with a job id.
+
+    Keeps WSGI workers free to accept new requests while the simulation
+    runs; poll /analyze/status/<job_id> for the result.
+    """
+    data = _payload()
+    reject = _reject_cards(data.get('hole', []), data.get('community', []))
+    if reject:
+        return reject
+    _prune_jobs()
+    job_id = uuid.uuid4().hex
+    _jobs[job_id] = (_job_executor.submit(_run_advanced, data),
+                     time.monotonic() + _JOB_TTL)
+    return ojsonify({'job_id': job_id}), 202
+
+
+@app.route('/analyze/status/<job_id>', methods=['GET'])
+def analyze_status(job_id):
+    """Poll a submitted job; the result is one-shot.
+
+    The first poll after completion returns the result (or error) and
+    consumes the job - later polls answer 404.
+    """
+    entry = _jobs.get(job_id)
+    if entry is None:
+        return ojsonify({'error': 'unknown job id'}), 404
+    future = entry[0]
+    if not future.done():
+        return ojsonify({'status': 'pending'})
+    # pop, not del: concurrent polls of a finished job may race past the
+    # get above, and only one of them gets to consume the entry
+    if _jobs.pop(job_id, None) is None:
+        return ojsonify({'error': 'unknown job id'}), 404
+    exc = future.exception()
+    if exc is not None:
+        return ojsonify({'status': 'error', 'error': str(exc)}), 500
+    return ojsonify({'status': 'done', 'result': future.result()})
+
+
 if __name__ == '__main__':
     app.run(debug=True)
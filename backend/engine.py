@@ -1,55 +1,121 @@
+from functools import lru_cache
 from typing import List, Tuple
+import itertools
 import random
-from treys import Card, Deck, Evaluator
+from treys import Card, Evaluator
+
+try:
+    from . import fast_equity
+except ImportError:  # pragma: no cover - numpy not installed
+    fast_equity = None
 
 
 evaluator = Evaluator()
 
 
+@lru_cache(maxsize=64)
 def _parse_card(card: str) -> int:
     """Parse a card like 'Ah' into treys integer."""
     return Card.new(card)
 
 
-def parse_cards(cards: List[str]) -> List[int]:
+def parse_cards(cards) -> List[int]:
     return [_parse_card(c) for c in cards]
 
 
 def evaluate_best_hand(hole_cards: List[str], community_cards: List[str]) -> Tuple[str, int]:
     """Return human readable hand type and score."""
-    hole = parse_cards(hole_cards)
-    board = parse_cards(community_cards)
+    # sorted tuples canonicalize card order so permutations share a slot
+    return _evaluate_best_hand_cached(tuple(sorted(hole_cards)),
+                                      tuple(sorted(community_cards)))
+
+
+@lru_cache(maxsize=32768)
+def _evaluate_best_hand_cached(hole_tuple: Tuple[str, ...],
+                               community_tuple: Tuple[str, ...]) -> Tuple[str, int]:
+    hole = parse_cards(hole_tuple)
+    board = parse_cards(community_tuple)
     score = evaluator.evaluate(board, hole)
     hand_type = evaluator.class_to_string(evaluator.get_rank_class(score))
     return hand_type, score
 
 
 def estimate_win_probability(hole_cards: List[str], community_cards: List[str], *,
-                             num_opponents: int = 1, trials: int = 1000) -> Tuple[float, float, float]:
-    """Monte Carlo simulation of win/tie/loss probabilities."""
+                             num_opponents: int = 1, trials: int = 1000,
+                             precision: float = 0.01,
+                             seed: int = None) -> Tuple[float, float, float]:
+    """Monte Carlo simulation of win/tie/loss probabilities.
+
+    Stops early once the win estimate's 95% confidence half-width drops
+    below ``precision``; ``trials`` caps the work either way.  Passing a
+    ``seed`` gives a reproducible run.
+    """
+    if fast_equity is not None:
+        return fast_equity.estimate_win_probability(
+            hole_cards, community_cards,
+            num_opponents=num_opponents, trials=trials, precision=precision,
+            seed=seed)
+    return _estimate_win_probability_py(hole_cards, community_cards,
+                                        num_opponents=num_opponents, trials=trials,
+                                        precision=precision, seed=seed)
+
+
+FULL_DECK = tuple(Card.new(r + s) for r in '23456789TJQKA' for s in 'shdc')
+
+
+def _estimate_win_probability_py(hole_cards: List[str], community_cards: List[str], *,
+                                 num_opponents: int = 1, trials: int = 1000,
+                                 precision: float = 0.01,
+                                 seed: int = None) -> Tuple[float, float, float]:
+    """Pure-Python fallback used when NumPy is unavailable."""
     hole = parse_cards(hole_cards)
     board = parse_cards(community_cards)
-    known_cards = set(hole_cards + community_cards)
+    dead = set(hole + board)
+    available = [c for c in FULL_DECK if c not in dead]
+
+    needed = 5 - len(board)
+    k = 2 * num_opponents + needed
+
+    if needed == 0:
+        # fixed river board: if no available holding beats or ties us, every
+        # trial is a win and the sampling loop can be skipped outright
+        player_score = evaluator.evaluate(board, hole)
+        nut_score = min(evaluator.evaluate(board, list(pair))
+                        for pair in itertools.combinations(available, 2))
+        if player_score < nut_score:
+            return 1.0, 0.0, 0.0
 
     wins = ties = losses = 0
 
+    # hoist method/global lookups out of the loop; the body runs
+    # trials * (1 + num_opponents) times
+    _eval = evaluator.evaluate
+    # a per-request Random sidesteps the lock on the module-global
+    # instance under threaded servers, and makes seeded runs replayable
+    _sample = random.Random(seed).sample
+    opp_offset = 2 * num_opponents
+    done = 0
+
     for _ in range(trials):
-        deck = Deck()
-        # remove known cards from deck
-        for c in known_cards:
-            deck.cards.remove(Card.new(c))
-
-        # deal opponent hands
-        opp_hands = []
-        for _ in range(num_opponents):
-            opp_hands.append([deck.draw(1)[0], deck.draw(1)[0]])
-        # deal remaining community
-        needed = 5 - len(board)
-        community_draw = [deck.draw(1)[0] for _ in range(needed)]
-        full_board = board + community_draw
-
-        player_score = evaluator.evaluate(full_board, hole)
-        best_opp = min(evaluator.evaluate(full_board, hand) for hand in opp_hands)
+        draw = _sample(available, k)
+        full_board = board + draw[opp_offset:]
+
+        player_score = _eval(full_board, hole)
+
+        if num_opponents == 1:
+            # heads-up is the common case: no loop, no extra slicing
+            best_opp = _eval(full_board, draw[:2])
+        else:
+            # treys scores are lower-is-better; stop at the first opponent
+            # who beats us instead of evaluating the rest
+            best_opp = None
+            for i in range(num_opponents):
+                score = _eval(full_board, draw[2 * i:2 * i + 2])
+                if score < player_score:
+                    best_opp = score
+                    break
+                if best_opp is None or score < best_opp:
+                    best_opp = score
 
         if player_score < best_opp:
             wins += 1
@@ -58,5 +124,13 @@ def estimate_win_probability(hole_cards: List[str], community_cards: List[str],
         else:
             losses += 1
 
-    total = float(trials)
+        done += 1
+        # Wald check every 200 trials: stop once the 95% half-width on the
+        # win estimate is inside the requested precision
+        if done % 200 == 0 and done >= 400:
+            p = wins / done
+            if 1.96 * (p * (1.0 - p) / done) ** 0.5 < precision:
+                break
+
+    total = float(done)
     return wins / total, ties / total, losses / total
@@ -0,0 +1,612 @@
+"""NumPy-vectorized Monte Carlo equity simulation.
+
+Cards are encoded as a single ``uint8`` per card: ``rank * 4 + suit`` with
+rank 0..12 (deuce..ace) and suit 0..3.  Whole batches of trial deals are
+drawn at once and evaluated with bitmap lookups instead of per-trial
+Python loops.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Callable, List, Tuple
+import json
+import os
+import threading
+import numpy as np
+
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - numba is optional
+    _HAVE_NUMBA = False
+
+_TABLE_DIR = os.path.join(os.path.dirname(__file__), 'tables')
+
+RANKS = '23456789TJQKA'
+SUITS = 'shdc'
+
+_RANK_INDEX = {r: i for i, r in enumerate(RANKS)}
+_SUIT_INDEX = {s: i for i, s in enumerate(SUITS)}
+
+# 128-entry LUTs keyed by ASCII code so whole card lists parse as one
+# vectorized gather instead of per-card dict lookups
+_RANK_LUT = np.zeros(128, dtype=np.uint8)
+_SUIT_LUT = np.zeros(128, dtype=np.uint8)
+for _c, _i in _RANK_INDEX.items():
+    _RANK_LUT[ord(_c)] = _i
+for _c, _i in _SUIT_INDEX.items():
+    _SUIT_LUT[ord(_c)] = _i
+
+# Hand categories, higher is better.  Final strength is
+# ``category << 20 | tiebreak`` where tiebreak packs up to five ranks in
+# 4-bit nibbles, so strengths compare directly as integers.
+_HIGH_CARD = 0
+_PAIR = 1
+_TWO_PAIR = 2
+_TRIPS = 3
+_STRAIGHT = 4
+_FLUSH = 5
+_FULL_HOUSE = 6
+_QUADS = 7
+_STRAIGHT_FLUSH = 8
+
+
+def _build_straight_lut() -> np.ndarray:
+    """For every 13-bit rank set, the high rank of the best straight or -1."""
+    lut = np.full(8192, -1, dtype=np.int32)
+    for bits in range(8192):
+        best = -1
+        # wheel: A-2-3-4-5
+        if bits & 0b1000000001111 == 0b1000000001111:
+            best = 3
+        for high in range(4, 13):
+            window = 0b11111 << (high - 4)
+            if bits & window == window:
+                best = high
+        lut[bits] = best
+    return lut
+
+
+def _build_top5_lut() -> np.ndarray:
+    """For every 13-bit rank set, the top five ranks packed as 4-bit nibbles."""
+    lut = np.zeros(8192, dtype=np.int32)
+    for bits in range(8192):
+        packed = 0
+        found = 0
+        for rank in range(12, -1, -1):
+            if bits & (1 << rank):
+                packed = (packed << 4) | rank
+                found += 1
+                if found == 5:
+                    break
+        # left-align so a 5-rank pack always occupies the same nibbles
+        lut[bits] = packed << (4 * (5 - found))
+    return lut
+
+
+def _build_topbit_lut() -> np.ndarray:
+    """Highest set bit index for every 13-bit value (0 for empty)."""
+    lut = np.zeros(8192, dtype=np.int32)
+    for bits in range(1, 8192):
+        lut[bits] = bits.bit_length() - 1
+    return lut
+
+
+def _load_table(name: str, builder: Callable[[], np.ndarray]) -> np.ndarray:
+    """Load a lookup table memory-mapped from disk, building it on first use.
+
+    Building the tables is cheap but the on-disk copy lets every worker
+    process map the same read-only pages instead of each holding its own.
+    """
+    path = os.path.join(_TABLE_DIR, name + '.npy')
+    if not os.path.exists(path):
+        os.makedirs(_TABLE_DIR, exist_ok=True)
+        tmp = '%s.%d.tmp' % (path, os.getpid())
+        with open(tmp, 'wb') as fh:
+            np.save(fh, builder())
+        os.replace(tmp, path)
+    return np.load(path, mmap_mode='r')
+
+
+_STRAIGHT_LUT = _load_table('straight', _build_straight_lut)
+_TOP5_LUT = _load_table('top5', _build_top5_lut)
+_TOPBIT_LUT = _load_table('topbit', _build_topbit_lut)
+
+_RANK_POW2 = (1 << np.arange(13)).astype(np.int32)
+
+
+def encode_card(card: str) -> int:
+    """Encode a card like 'Ah' to its uint8 code."""
+    return _RANK_INDEX[card[0]] * 4 + _SUIT_INDEX[card[1]]
+
+
+def encode_cards(cards: List[str]) -> np.ndarray:
+    if not cards:
+        return np.empty(0, dtype=np.uint8)
+    ascii_pairs = np.frombuffer(''.join(cards).encode(), dtype=np.uint8).reshape(-1, 2)
+    return _RANK_LUT[ascii_pairs[:, 0]] * 4 + _SUIT_LUT[ascii_pairs[:, 1]]
+
+
+def evaluate7(hands: np.ndarray) -> np.ndarray:
+    """Evaluate an (N, 7) uint8 array of hands; returns int32 strengths.
+
+    Higher strength wins.  Ties in strength are exact ties.
+    """
+    n = hands.shape[0]
+    ranks = (hands >> 2).astype(np.int64)
+    suits = (hands & 3).astype(np.int64)
+
+    row = np.arange(n)
+    rank_counts = np.bincount(
+        (ranks + 13 * row[:, None]).ravel(), minlength=13 * n
+    ).reshape(n, 13)
+    suit_counts = np.bincount(
+        (suits + 4 * row[:, None]).ravel(), minlength=4 * n
+    ).reshape(n, 4)
+
+    rank_bits = (rank_counts > 0) @ _RANK_POW2
+    pair_bits = (rank_counts == 2) @ _RANK_POW2
+    trip_bits = (rank_counts == 3) @ _RANK_POW2
+    quad_bits = (rank_counts == 4) @ _RANK_POW2
+
+    # flushes: at most one suit can have 5+ cards of 7
+    flush_suit = np.argmax(suit_counts, axis=1)
+    has_flush = suit_counts[row, flush_suit] >= 5
+    flush_bits = ((suits == flush_suit[:, None]) * (1 << ranks)).sum(axis=1)
+    flush_bits = np.where(has_flush, flush_bits, 0).astype(np.int64)
+
+    straight_high = _STRAIGHT_LUT[rank_bits]
+    sflush_high = _STRAIGHT_LUT[flush_bits]
+
+    quad_rank = _TOPBIT_LUT[quad_bits]
+    quad_kicker = _TOPBIT_LUT[rank_bits & ~(1 << quad_rank)]
+
+    trip_rank = _TOPBIT_LUT[trip_bits]
+    # a second set of trips plays as the pair of a full house
+    fh_pair = _TOPBIT_LUT[(trip_bits & ~(1 << trip_rank)) | pair_bits]
+    has_full_house = (trip_bits != 0) & (((trip_bits & ~(1 << trip_rank)) | pair_bits) != 0)
+
+    pair_rank = _TOPBIT_LUT[pair_bits]
+    second_pair = _TOPBIT_LUT[pair_bits & ~(1 << pair_rank)]
+
+    trips_kickers = _TOP5_LUT[rank_bits & ~(1 << trip_rank)] >> 12
+    two_pair_kicker = _TOPBIT_LUT[rank_bits & ~(1 << pair_rank) & ~(1 << second_pair)]
+    pair_kickers = _TOP5_LUT[rank_bits & ~(1 << pair_rank)] >> 8
+
+    strength = np.select(
+        [
+            sflush_high >= 0,
+            quad_bits != 0,
+            has_full_house,
+            has_flush,
+            straight_high >= 0,
+            trip_bits != 0,
+            (pair_bits & ~(1 << pair_rank)) != 0,
+            pair_bits != 0,
+        ],
+        [
+            (_STRAIGHT_FLUSH << 20) | sflush_high,
+            (_QUADS << 20) | (quad_rank << 4) | quad_kicker,
+            (_FULL_HOUSE << 20) | (trip_rank << 4) | fh_pair,
+            (_FLUSH << 20) | _TOP5_LUT[flush_bits],
+            (_STRAIGHT << 20) | straight_high,
+            (_TRIPS << 20) | (trip_rank << 8) | trips_kickers,
+            (_TWO_PAIR << 20) | (pair_rank << 8) | (second_pair << 4) | two_pair_kicker,
+            (_PAIR << 20) | (pair_rank << 12) | pair_kickers,
+        ],
+        default=(_HIGH_CARD << 20) | _TOP5_LUT[rank_bits],
+    )
+    return strength.astype(np.int32)
+
+
+if _HAVE_NUMBA:
+    @njit(cache=True)
+    def _evaluate7_one(cards, straight_lut, top5_lut, topbit_lut):
+        """Scalar twin of :func:`evaluate7` for the JIT Monte Carlo kernel."""
+        rank_counts = np.zeros(13, dtype=np.int32)
+        suit_counts = np.zeros(4, dtype=np.int32)
+        for i in range(7):
+            rank_counts[cards[i] >> 2] += 1
+            suit_counts[cards[i] & 3] += 1
+        rank_bits = 0
+        pair_bits = 0
+        trip_bits = 0
+        quad_bits = 0
+        for r in range(13):
+            c = rank_counts[r]
+            if c > 0:
+                rank_bits |= 1 << r
+                if c == 2:
+                    pair_bits |= 1 << r
+                elif c == 3:
+                    trip_bits |= 1 << r
+                elif c == 4:
+                    quad_bits |= 1 << r
+        flush_suit = -1
+        for s in range(4):
+            if suit_counts[s] >= 5:
+                flush_suit = s
+        flush_bits = 0
+        if flush_suit >= 0:
+            for i in range(7):
+                if cards[i] & 3 == flush_suit:
+                    flush_bits |= 1 << (cards[i] >> 2)
+            sflush_high = straight_lut[flush_bits]
+            if sflush_high >= 0:
+                return (_STRAIGHT_FLUSH << 20) | sflush_high
+        if quad_bits != 0:
+            quad_rank = topbit_lut[quad_bits]
+            kicker = topbit_lut[rank_bits & ~(1 << quad_rank)]
+            return (_QUADS << 20) | (quad_rank << 4) | kicker
+        if trip_bits != 0:
+            trip_rank = topbit_lut[trip_bits]
+            fh_pair_bits = (trip_bits & ~(1 << trip_rank)) | pair_bits
+            if fh_pair_bits != 0:
+                return (_FULL_HOUSE << 20) | (trip_rank << 4) | topbit_lut[fh_pair_bits]
+        if flush_suit >= 0:
+            return (_FLUSH << 20) | top5_lut[flush_bits]
+        straight_high = straight_lut[rank_bits]
+        if straight_high >= 0:
+            return (_STRAIGHT << 20) | straight_high
+        if trip_bits != 0:
+            trip_rank = topbit_lut[trip_bits]
+            kickers = top5_lut[rank_bits & ~(1 << trip_rank)] >> 12
+            return (_TRIPS << 20) | (trip_rank << 8) | kickers
+        if pair_bits != 0:
+            pair_rank = topbit_lut[pair_bits]
+            rest = pair_bits & ~(1 << pair_rank)
+            if rest != 0:
+                second_pair = topbit_lut[rest]
+                kicker = topbit_lut[rank_bits & ~(1 << pair_rank) & ~(1 << second_pair)]
+                return (_TWO_PAIR << 20) | (pair_rank << 8) | (second_pair << 4) | kicker
+            kickers = top5_lut[rank_bits & ~(1 << pair_rank)] >> 8
+            return (_PAIR << 20) | (pair_rank << 12) | kickers
+        return (_HIGH_CARD << 20) | top5_lut[rank_bits]
+
+    @njit(cache=True)
+    def _mc_kernel(hole, board, avail, num_opp, trials, seed,
+                   straight_lut, top5_lut, topbit_lut):
+        """Full Monte Carlo loop (deal + evaluate + compare) at native speed."""
+        np.random.seed(seed)
+        n_board = board.size
+        needed = 5 - n_board
+        draw = 2 * num_opp + needed
+        n_avail = avail.size
+        wins = 0
+        ties = 0
+        for t in range(trials):
+            # partial Fisher-Yates: only the first `draw` slots matter
+            deck = avail.copy()
+            for i in range(draw):
+                j = np.random.randint(i, n_avail)
+                tmp = deck[i]
+                deck[i] = deck[j]
+                deck[j] = tmp
+            cards = np.empty(7, dtype=np.uint8)
+            cards[0] = hole[0]
+            cards[1] = hole[1]
+            for i in range(n_board):
+                cards[2 + i] = board[i]
+            for i in range(needed):
+                cards[2 + n_board + i] = deck[2 * num_opp + i]
+            hero = _evaluate7_one(cards, straight_lut, top5_lut, topbit_lut)
+            best_opp = -1
+            for o in range(num_opp):
+                cards[0] = deck[2 * o]
+                cards[1] = deck[2 * o + 1]
+                strength = _evaluate7_one(cards, straight_lut, top5_lut, topbit_lut)
+                if strength > best_opp:
+                    best_opp = strength
+            if hero > best_opp:
+                wins += 1
+            elif hero == best_opp:
+                ties += 1
+        return wins, ties, trials - wins - ties
+
+
+_scratch_store = threading.local()
+
+
+def _scratch(name: str, shape: Tuple[int, ...], dtype) -> np.ndarray:
+    """Per-thread reusable buffer so repeated batches stop re-allocating.
+
+    Buffers are keyed by name and exact shape; server traffic repeats the
+    same (trials, deck) shapes constantly, so hits dominate after warmup.
+    """
+    store = getattr(_scratch_store, 'buffers', None)
+    if store is None:
+        store = _scratch_store.buffers = {}
+    buf = store.get((name, shape))
+    if buf is None:
+        buf = store[(name, shape)] = np.empty(shape, dtype=dtype)
+    return buf
+
+
+def simulate(hole_cards: List[str], community_cards: List[str], *,
+             num_opponents: int = 1, trials: int = 1000,
+             rng: np.random.Generator = None) -> Tuple[int, int, int]:
+    """Run all trials as one vectorized batch; returns (wins, ties, losses)."""
+    if rng is None:
+        rng = np.random.default_rng()
+
+    hole = encode_cards(hole_cards)
+    board = encode_cards(community_cards)
+    known = set(hole.tolist()) | set(board.tolist())
+    available = np.array([c for c in range(52) if c not in known], dtype=np.uint8)
+
+    needed = 5 - len(board)
+    draw = 2 * num_opponents + needed
+
+    if _HAVE_NUMBA:
+        # the JIT kernel runs deal + evaluate + compare in one native loop,
+        # with no batch-sized temporaries at all
+        seed = int(rng.integers(1 << 31))
+        wins, ties, losses = _mc_kernel(
+            hole, board, available, num_opponents, trials, seed,
+            _STRAIGHT_LUT, _TOP5_LUT, _TOPBIT_LUT)
+        return int(wins), int(ties), int(losses)
+
+    # partial shuffle: attach a random key to every deck slot and keep the
+    # `draw` smallest per row; cheaper than permuting all ~45 columns when
+    # only a handful of cards are actually dealt
+    keys = _scratch('keys', (trials, available.size), np.float64)
+    rng.random(out=keys)
+    idx = np.argpartition(keys, draw, axis=1)[:, :draw]
+    dealt = available[idx]
+
+    hero = _scratch('hero', (trials, 7), np.uint8)
+    hero[:, :2] = hole
+    hero[:, 2:2 + len(board)] = board
+    hero[:, 2 + len(board):] = dealt[:, 2 * num_opponents:draw]
+    full_board = hero[:, 2:]
+    hero_strength = evaluate7(hero)
+
+    best_opp = np.zeros(trials, dtype=np.int32)
+    opp = _scratch('opp', (trials, 7), np.uint8)
+    opp[:, 2:] = full_board
+    for i in range(num_opponents):
+        opp[:, :2] = dealt[:, 2 * i:2 * i + 2]
+        np.maximum(best_opp, evaluate7(opp), out=best_opp)
+
+    wins = int(np.count_nonzero(hero_strength > best_opp))
+    ties = int(np.count_nonzero(hero_strength == best_opp))
+    return wins, ties, trials - wins - ties
+
+
+def simulate_adaptive(hole_cards: List[str], community_cards: List[str], *,
+                      num_opponents: int = 1, max_trials: int = 10000,
+                      epsilon: float = 0.01, chunk: int = 256,
+                      rng: np.random.Generator = None) -> Tuple[int, int, int]:
+    """Run batched trials until the equity estimate is tight enough.
+
+    Stops once the 95% standard-error bound on win probability drops below
+    ``epsilon`` (or the trial budget is spent).  Lopsided spots converge in
+    a few hundred trials instead of burning the full budget.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+
+    wins = ties = losses = 0
+    done = 0
+    while done < max_trials:
+        batch = min(chunk, max_trials - done)
+        w, t, l = simulate(hole_cards, community_cards,
+                           num_opponents=num_opponents, trials=batch, rng=rng)
+        wins += w
+        ties += t
+        losses += l
+        done += batch
+        p = wins / done
+        if done >= 2 * chunk and 1.96 * (p * (1.0 - p) / done) ** 0.5 < epsilon:
+            break
+    return wins, ties, losses
+
+
+def preflop_class(hole_cards: List[str]) -> str:
+    """Canonical class of a starting hand: 'AA', 'AKs' or 'AKo'."""
+    a, b = hole_cards
+    if _RANK_INDEX[a[0]] < _RANK_INDEX[b[0]]:
+        a, b = b, a
+    if a[0] == b[0]:
+        return a[0] + b[0]
+    return a[0] + b[0] + ('s' if a[1] == b[1] else 'o')
+
+
+# (hand_class, num_opponents) -> (win, tie, loss) fractions.  Preflop
+# equity depends only on the 169 canonical classes, so one high-precision
+# simulation per class serves every later request.  The table persists
+# beside the lookup tables so restarts and pool workers start warm.
+_PREFLOP_CACHE = {}
+_PREFLOP_TRIALS = 100000
+_PREFLOP_PATH = os.path.join(_TABLE_DIR, 'preflop.json')
+
+
+def _load_preflop_cache() -> dict:
+    try:
+        with open(_PREFLOP_PATH) as fh:
+            raw = json.load(fh)
+    except (OSError, ValueError):
+        return {}
+    cache = {}
+    for key, probs in raw.items():
+        hand_class, opponents = key.rsplit(':', 1)
+        cache[(hand_class, int(opponents))] = tuple(probs)
+    return cache
+
+
+def _save_preflop_cache() -> None:
+    raw = {'%s:%d' % key: probs for key, probs in _PREFLOP_CACHE.items()}
+    os.makedirs(_TABLE_DIR, exist_ok=True)
+    tmp = '%s.%d.tmp' % (_PREFLOP_PATH, os.getpid())
+    with open(tmp, 'w') as fh:
+        json.dump(raw, fh)
+    os.replace(tmp, _PREFLOP_PATH)
+
+
+_PREFLOP_CACHE.update(_load_preflop_cache())
+
+
+def _preflop_probabilities(hole_cards: List[str],
+                           num_opponents: int) -> Tuple[float, float, float]:
+    key = (preflop_class(hole_cards), num_opponents)
+    probs = _PREFLOP_CACHE.get(key)
+    if probs is None:
+        wins, ties, losses = simulate(hole_cards, [],
+                                      num_opponents=num_opponents,
+                                      trials=_PREFLOP_TRIALS)
+        total = float(_PREFLOP_TRIALS)
+        probs = (wins / total, ties / total, losses / total)
+        _PREFLOP_CACHE[key] = probs
+        _save_preflop_cache()
+    return probs
+
+
+# below this many trials the pool dispatch overhead outweighs the parallelism
+_PARALLEL_THRESHOLD = 20000
+
+_POOL = None
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Lazily create one process pool and reuse it for every request.
+
+    Spawning a pool per call cost more than the parallelism saved; a
+    module-level singleton pays the fork cost once per process.
+    """
+    global _POOL
+    if _POOL is None:
+        _POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _POOL
+
+
+def _simulate_chunk(hole_cards: List[str], community_cards: List[str],
+                    num_opponents: int, trials: int,
+                    seed: np.random.SeedSequence) -> Tuple[int, int, int]:
+    """Module-level (picklable) worker running one chunk of trials."""
+    rng = np.random.default_rng(seed)
+    return simulate(hole_cards, community_cards,
+                    num_opponents=num_opponents, trials=trials, rng=rng)
+
+
+def simulate_parallel(hole_cards: List[str], community_cards: List[str], *,
+                      num_opponents: int = 1,
+                      trials: int = 1000) -> Tuple[int, int, int]:
+    """Split trials over a process pool; chunks use distinct seeds."""
+    workers = os.cpu_count() or 1
+    chunk = trials // workers
+    sizes = [chunk] * (workers - 1) + [trials - chunk * (workers - 1)]
+    # spawned children share entropy but carry distinct spawn keys, so the
+    # SeedSequence itself (picklable) is what must cross the process
+    # boundary - its .entropy alone would seed every chunk identically
+    seeds = np.random.SeedSequence().spawn(workers)
+    pool = _get_pool()
+    futures = [
+        pool.submit(_simulate_chunk, hole_cards, community_cards,
+                    num_opponents, size, seed)
+        for size, seed in zip(sizes, seeds)
+    ]
+    wins = ties = losses = 0
+    for future in futures:
+        w, t, l = future.result()
+        wins += w
+        ties += t
+        losses += l
+    return wins, ties, losses
+
+
+def enumerate_river(hole_cards: List[str],
+                    community_cards: List[str]) -> Tuple[int, int, int]:
+    """Exact heads-up (wins, ties, losses) over all river opponent holdings.
+
+    With five board cards known the only unknown is the opponent's hole
+    cards, so the C(45,2) = 990 combinations enumerate exactly for less
+    work than a 1000-trial simulation.
+    """
+    hole = encode_cards(hole_cards)
+    board = encode_cards(community_cards)
+    known = set(hole.tolist()) | set(board.tolist())
+    available = np.array([c for c in range(52) if c not in known], dtype=np.uint8)
+
+    hero = np.concatenate([hole, board])[None, :]
+    hero_strength = evaluate7(hero)[0]
+
+    first, second = np.triu_indices(available.size, k=1)
+    opp = np.empty((first.size, 7), dtype=np.uint8)
+    opp[:, 0] = available[first]
+    opp[:, 1] = available[second]
+    opp[:, 2:] = board
+    strengths = evaluate7(opp)
+
+    wins = int(np.count_nonzero(hero_strength > strengths))
+    ties = int(np.count_nonzero(hero_strength == strengths))
+    return wins, ties, first.size - wins - ties
+
+
+@lru_cache(maxsize=50000)
+def _enumerate_river_cached(canon_hole: Tuple[str, ...],
+                            canon_board: Tuple[str, ...]) -> Tuple[float, float, float]:
+    wins, ties, losses = enumerate_river(list(canon_hole), list(canon_board))
+    total = float(wins + ties + losses)
+    return wins / total, ties / total, losses / total
+
+
+def canonicalize_suits(hole_cards: List[str],
+                       community_cards: List[str]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Relabel suits by first appearance so isomorphic spots share a key.
+
+    AhKh on QhJh2c and AsKs on QsJs2d describe the same situation; mapping
+    suits in traversal order over the sorted cards collapses the ~24 suit
+    permutations of a spot to one canonical form.
+    """
+    mapping = {}
+    def relabel(cards):
+        out = []
+        for card in sorted(cards):
+            suit = mapping.get(card[1])
+            if suit is None:
+                suit = mapping[card[1]] = SUITS[len(mapping)]
+            out.append(card[0] + suit)
+        return tuple(out)
+    return relabel(hole_cards), relabel(community_cards)
+
+
+@lru_cache(maxsize=50000)
+def _estimate_cached(canon_hole: Tuple[str, ...], canon_board: Tuple[str, ...],
+                     num_opponents: int, trials: int,
+                     epsilon: float) -> Tuple[float, float, float]:
+    if trials >= _PARALLEL_THRESHOLD and (os.cpu_count() or 1) > 1:
+        wins, ties, losses = simulate_parallel(
+            list(canon_hole), list(canon_board),
+            num_opponents=num_opponents, trials=trials)
+    else:
+        wins, ties, losses = simulate_adaptive(
+            list(canon_hole), list(canon_board),
+            num_opponents=num_opponents, max_trials=trials, epsilon=epsilon)
+    total = float(wins + ties + losses)
+    return wins / total, ties / total, losses / total
+
+
+def estimate_win_probability(hole_cards: List[str], community_cards: List[str], *,
+                             num_opponents: int = 1, trials: int = 1000,
+                             precision: float = 0.01,
+                             seed: int = None) -> Tuple[float, float, float]:
+    """Drop-in vectorized equivalent of the scalar engine loop.
+
+    ``precision`` is the 95% confidence half-width at which the adaptive
+    simulation stops early; ``trials`` remains the hard budget.  A
+    ``seed`` makes the run reproducible and bypasses the stochastic
+    caches (exact river answers are returned either way).
+    """
+    canon_hole, canon_board = canonicalize_suits(hole_cards, community_cards)
+    if len(canon_board) == 5 and num_opponents == 1:
+        return _enumerate_river_cached(canon_hole, canon_board)
+    if seed is not None:
+        wins, ties, losses = simulate_adaptive(
+            list(canon_hole), list(canon_board),
+            num_opponents=num_opponents, max_trials=trials, epsilon=precision,
+            rng=np.random.default_rng(seed))
+        total = float(wins + ties + losses)
+        return wins / total, ties / total, losses / total
+    if not community_cards:
+        return _preflop_probabilities(hole_cards, num_opponents)
+    return _estimate_cached(canon_hole, canon_board, num_opponents, trials, precision)
@@ -0,0 +1,181 @@
+"""Game-theory helpers: range strength, GTO-style strategy mixes, Nash.
+
+Shares the 169-hand indexing from :mod:`ranges`; per-hand preflop
+strength lives in an array aligned with that order so whole ranges
+reduce with one gather instead of per-hand dict lookups.
+"""
+
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+import hashlib
+
+import numpy as np
+
+from .ranges import RangeAnalyzer, _chen_score
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+_analyzer = RangeAnalyzer()
+_HAND_TO_IDX = _analyzer.hand_to_idx
+
+# per-hand strength in [0, 1], row-aligned with RangeAnalyzer.all_hands
+PREFLOP_STRENGTH_ARR = np.clip(
+    np.array([_chen_score(hand) for hand in _analyzer.all_hands],
+             dtype=np.float32) / 20.0,
+    0.0, 1.0)
+
+
+def _range_indices(hands: List[str]) -> np.ndarray:
+    return np.fromiter((_HAND_TO_IDX[h] for h in hands),
+                       dtype=np.int16, count=len(hands))
+
+
+class OpponentTendencies(NamedTuple):
+    """Observed opponent frequencies used to shade the strategy mix.
+
+    A named tuple instead of a dict: attribute access is an indexed
+    load rather than a hashed string lookup in the hot path, and the
+    tuple is hashable for memoization keys.
+    """
+    aggression: float = 0.5
+    fold_to_bet: float = 0.5
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, float]) -> 'OpponentTendencies':
+        """Build from dict-era keyword data, ignoring unknown keys."""
+        return cls(**{k: v for k, v in data.items() if k in cls._fields})
+
+
+_DEFAULT_TENDENCIES = OpponentTendencies()
+
+
+@lru_cache(maxsize=4096)
+def _range_strength(hands: Tuple[str, ...]) -> float:
+    """Mean preflop strength of a range; cached so the gather runs once
+    per distinct range rather than once per strategy query."""
+    return float(PREFLOP_STRENGTH_ARR[_range_indices(hands)].mean())
+
+
+@njit(cache=True)
+def _regret_match(matrix: np.ndarray, iters: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Regret matching on a zero-sum payoff matrix (row player maximizes).
+
+    The average strategy profile converges to a Nash equilibrium; the
+    whole loop is array arithmetic, so it JIT-compiles cleanly.
+    """
+    rows, cols = matrix.shape
+    regret_row = np.zeros(rows)
+    regret_col = np.zeros(cols)
+    sum_row = np.zeros(rows)
+    sum_col = np.zeros(cols)
+    for _ in range(iters):
+        pos_row = np.maximum(regret_row, 0.0)
+        total = pos_row.sum()
+        strat_row = pos_row / total if total > 0 else np.full(rows, 1.0 / rows)
+        pos_col = np.maximum(regret_col, 0.0)
+        total = pos_col.sum()
+        strat_col = pos_col / total if total > 0 else np.full(cols, 1.0 / cols)
+
+        # explicit loops instead of @: numba lowers matmul through BLAS,
+        # which would drag in a scipy dependency for two tiny products
+        payoff_row = np.zeros(rows)
+        payoff_col = np.zeros(cols)
+        value = 0.0
+        for i in range(rows):
+            for j in range(cols):
+                payoff_row[i] += matrix[i, j] * strat_col[j]
+                payoff_col[j] += strat_row[i] * matrix[i, j]
+            value += strat_row[i] * payoff_row[i]
+        regret_row += payoff_row - value
+        regret_col += value - payoff_col
+        sum_row += strat_row
+        sum_col += strat_col
+    return sum_row / iters, sum_col / iters
+
+
+@lru_cache(maxsize=200_000)
+def _gto_impl(position: str, stack_bucket: float,
+              hand_range: Tuple[str, ...], opponent_range: Tuple[str, ...],
+              fold_to_bet: float, aggression: float
+              ) -> Tuple[float, float, float]:
+    """Cached (fold, call, raise) mix; all arguments are hashable."""
+    edge = _range_strength(hand_range) - _range_strength(opponent_range)
+
+    raise_freq = 0.25 + edge
+    if position in ('button', 'cutoff'):
+        raise_freq += 0.05
+    if stack_bucket < 15:
+        # shallow stacks polarize toward shove-or-fold
+        raise_freq += 0.1
+    raise_freq += 0.1 * (fold_to_bet - 0.5)
+
+    call_freq = 0.35 - 0.2 * (aggression - 0.5)
+
+    raise_freq = min(max(raise_freq, 0.0), 1.0)
+    call_freq = min(max(call_freq, 0.0), 1.0 - raise_freq)
+    return 1.0 - raise_freq - call_freq, call_freq, raise_freq
+
+
+class GameTheoryOptimal:
+    """Strategy advice from range strength and simple equilibrium logic."""
+
+    def __init__(self):
+        self.nash_equilibrium_cache = {}
+
+    def _calculate_range_strength(self, our_range: List[str],
+                                  opponent_range: List[str]) -> Tuple[float, float]:
+        """Mean preflop strength of both ranges; cached per range."""
+        return (_range_strength(tuple(our_range)),
+                _range_strength(tuple(opponent_range)))
+
+    def calculate_gto_strategy(self, position: str, stack_depth: float,
+                               hand_range: List[str], opponent_range: List[str],
+                               opponent_tendencies: Union[
+                                   OpponentTendencies, Dict[str, float], None] = None
+                               ) -> Dict[str, float]:
+        """Fold/call/raise frequency mix for a spot.
+
+        Strength edge sets the baseline aggression; position, stack depth
+        and observed opponent tendencies shift it.  The computation is
+        memoized: stack depth is bucketed to half a big blind and ranges
+        are sorted, so recurring preflop spots hit the cache.
+
+        Tendencies are an :class:`OpponentTendencies` tuple; plain dicts
+        are still accepted and converted.
+        """
+        if opponent_tendencies is None:
+            tendencies = _DEFAULT_TENDENCIES
+        elif isinstance(opponent_tendencies, OpponentTendencies):
+            tendencies = opponent_tendencies
+        else:
+            tendencies = OpponentTendencies.from_dict(opponent_tendencies)
+        fold, call, raise_ = _gto_impl(
+            position, round(stack_depth * 2.0) / 2.0,
+            tuple(sorted(hand_range)), tuple(sorted(opponent_range)),
+            tendencies.fold_to_bet, tendencies.aggression)
+        return {'fold': fold, 'call': call, 'raise': raise_}
+
+    def calculate_nash_equilibrium(self, game_matrix: List[List[float]],
+                                   iters: int = 10000
+                                   ) -> Tuple[List[float], List[float]]:
+        """Equilibrium mix for a zero-sum matrix game via regret matching.
+
+        Solutions are cached by a digest of the matrix bytes plus the
+        iteration count, so repeat queries for the same game are
+        dictionary lookups and a higher-precision request never gets a
+        coarser cached answer.
+        """
+        matrix = np.ascontiguousarray(game_matrix, dtype=np.float64)
+        key = (hashlib.blake2b(matrix.tobytes(), digest_size=16).digest(),
+               iters)
+        cached = self.nash_equilibrium_cache.get(key)
+        if cached is None:
+            row, col = _regret_match(matrix, iters)
+            cached = self.nash_equilibrium_cache[key] = (row.tolist(), col.tolist())
+        return cached
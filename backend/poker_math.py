@@ -0,0 +1,290 @@
+"""Scalar poker arithmetic: odds, expected value and bet sizing.
+
+The formulas are tiny float kernels, so they are compiled with numba
+when it is available; the ``PokerMath`` statics stay thin dispatchers
+with the original signatures.  Without numba the same functions run as
+plain Python.
+"""
+
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Union
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+class HandStrength(IntEnum):
+    """Five-card hand categories, weakest to strongest.
+
+    Values index straight into the tuples below, so rankings-related
+    lookups are an array fetch instead of hashing a category string.
+    """
+    HIGH_CARD = 1
+    PAIR = 2
+    TWO_PAIR = 3
+    THREE_OF_A_KIND = 4
+    STRAIGHT = 5
+    FLUSH = 6
+    FULL_HOUSE = 7
+    FOUR_OF_A_KIND = 8
+    STRAIGHT_FLUSH = 9
+    ROYAL_FLUSH = 10
+
+
+# distinct five-card combinations per category, indexed by
+# HandStrength.value (slot 0 is an unused sentinel)
+_COMBINATIONS = (0, 1302540, 1098240, 123552, 54912, 10200,
+                 5108, 3744, 624, 36, 4)
+
+# string names accepted for backward compatibility with dict-era callers
+_HAND_NAMES = {member.name.lower(): member for member in HandStrength}
+
+# rough outs to improve, by draw description
+_OUT_ESTIMATES = {
+    'gutshot': 4,
+    'open_ended': 8,
+    'flush_draw': 9,
+    'flush_draw_open_ended': 15,
+    'overcard': 3,
+    'two_overcards': 6,
+    'pair_to_trips': 2,
+    'set_to_full_house_or_quads': 7,
+}
+
+
+@dataclass(slots=True, frozen=True)
+class PokerOdds:
+    """Odds summary for one decision point.
+
+    Slotted and frozen: thousands of these flow out of batch analysis,
+    so fixed-slot storage halves the footprint, and immutability makes
+    instances usable as memoization keys.
+    """
+    win_probability: float
+    tie_probability: float
+    loss_probability: float
+    pot_odds: float
+    expected_value: float
+
+
+@dataclass(slots=True, frozen=True)
+class HandEquity:
+    """Equity of one holding, raw and after table adjustments."""
+    hand: str
+    raw_equity: float
+    adjusted_equity: float
+
+
+class PokerOddsBatch:
+    """Structure-of-arrays twin of :class:`PokerOdds` for many spots.
+
+    One float64 array per field instead of a list of instances, so
+    aggregations (mean equity, EV ranking) are single NumPy reductions
+    rather than N attribute lookups per field.
+    """
+
+    __slots__ = ('win_probability', 'tie_probability', 'loss_probability',
+                 'pot_odds', 'expected_value')
+
+    def __init__(self, win_probability, tie_probability, loss_probability,
+                 pot_odds, expected_value):
+        self.win_probability = np.asarray(win_probability, dtype=np.float64)
+        self.tie_probability = np.asarray(tie_probability, dtype=np.float64)
+        self.loss_probability = np.asarray(loss_probability, dtype=np.float64)
+        self.pot_odds = np.asarray(pot_odds, dtype=np.float64)
+        self.expected_value = np.asarray(expected_value, dtype=np.float64)
+
+    @classmethod
+    def from_spots(cls, win_probability, tie_probability, loss_probability,
+                   pot, to_call) -> 'PokerOddsBatch':
+        """Derive odds and EV for whole arrays of spots at once."""
+        win = np.asarray(win_probability, dtype=np.float64)
+        pot = np.asarray(pot, dtype=np.float64)
+        to_call = np.asarray(to_call, dtype=np.float64)
+        pot_odds = np.where(to_call > 0, to_call / (pot + to_call), 0.0)
+        ev = win * pot - (1.0 - win) * to_call
+        return cls(win, tie_probability, loss_probability, pot_odds, ev)
+
+    def __len__(self) -> int:
+        return self.win_probability.shape[0]
+
+    def best_by_ev(self) -> int:
+        """Index of the highest-EV spot."""
+        return int(np.argmax(self.expected_value))
+
+    def to_records(self):
+        """Per-spot PokerOdds instances, for callers that want objects."""
+        for i in range(len(self)):
+            yield PokerOdds(float(self.win_probability[i]),
+                            float(self.tie_probability[i]),
+                            float(self.loss_probability[i]),
+                            float(self.pot_odds[i]),
+                            float(self.expected_value[i]))
+
+
+@njit(cache=True, fastmath=True)
+def _pot_odds(pot: float, to_call: float) -> float:
+    if to_call <= 0.0:
+        return 0.0
+    return to_call / (pot + to_call)
+
+
+@njit(cache=True, fastmath=True)
+def _implied_odds(pot: float, to_call: float, expected_future: float) -> float:
+    if to_call <= 0.0:
+        return 0.0
+    return to_call / (pot + to_call + expected_future)
+
+
+@njit(cache=True, fastmath=True)
+def _expected_value(win_probability: float, pot: float, to_call: float) -> float:
+    return win_probability * pot - (1.0 - win_probability) * to_call
+
+
+@njit(cache=True, fastmath=True)
+def _minimum_defense_frequency(bet: float, pot: float) -> float:
+    if bet <= 0.0:
+        return 1.0
+    return pot / (pot + bet)
+
+
+@njit(cache=True, fastmath=True)
+def _optimal_bet_size(pot: float, fold_target: float) -> float:
+    # smallest bet laying the opponent worse odds than fold_target
+    if fold_target >= 1.0:
+        return pot * 4.0
+    if fold_target <= 0.0:
+        return 0.0
+    return pot * fold_target / (1.0 - fold_target)
+
+
+@njit(cache=True, fastmath=True)
+def _bluff_frequency(bet: float, pot: float) -> float:
+    # bluff share of a polarized betting range that makes calls indifferent
+    if bet <= 0.0:
+        return 0.0
+    return bet / (pot + 2.0 * bet)
+
+
+@njit(cache=True, fastmath=True)
+def _fold_equity(fold_probability: float, pot: float) -> float:
+    return fold_probability * pot
+
+
+def kelly_criterion_array(win_probability, win_amount, loss_amount) -> np.ndarray:
+    """Kelly fraction elementwise over arrays of scenarios.
+
+    Zero where the loss amount is non-positive or the edge is negative;
+    one vectorized expression, so what-if sweeps over win rates or
+    payouts cost a single pass instead of a Python loop per point.
+    """
+    p = np.asarray(win_probability, dtype=np.float64)
+    win = np.asarray(win_amount, dtype=np.float64)
+    loss = np.asarray(loss_amount, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        odds = np.where(loss > 0, win / np.where(loss > 0, loss, 1.0), 0.0)
+        fraction = np.where(odds > 0, (odds * p - (1.0 - p)) / np.where(odds > 0, odds, 1.0), 0.0)
+    return np.clip(fraction, 0.0, 1.0)
+
+
+def optimal_stake_array(bankroll, win_probability, win_amount, loss_amount,
+                        kelly_fraction: float = 0.5) -> np.ndarray:
+    """Stake per scenario: fractional-Kelly share of the bankroll."""
+    return (np.asarray(bankroll, dtype=np.float64) * kelly_fraction
+            * kelly_criterion_array(win_probability, win_amount, loss_amount))
+
+
+def risk_of_ruin_batch(bankroll, win_rate, std_dev, bet_size) -> np.ndarray:
+    """Risk of ruin elementwise over arrays of bankroll scenarios.
+
+    Invalid inputs (non-positive std dev, bet size or win rate) come
+    back as certain ruin, matching the scalar method; the masks keep
+    the expression branchless so what-if grids evaluate in one pass.
+    """
+    bankroll = np.asarray(bankroll, dtype=np.float64)
+    win_rate = np.asarray(win_rate, dtype=np.float64)
+    std_dev = np.asarray(std_dev, dtype=np.float64)
+    bet_size = np.asarray(bet_size, dtype=np.float64)
+    z = np.where(std_dev > 0, win_rate / np.where(std_dev > 0, std_dev, 1.0), 0.0)
+    units = np.where(bet_size > 0, bankroll / np.where(bet_size > 0, bet_size, 1.0), 0.0)
+    ruin = np.minimum(np.exp(-2.0 * z * units), 1.0)
+    return np.where((std_dev > 0) & (bet_size > 0) & (win_rate > 0), ruin, 1.0)
+
+
+class BankrollManagement:
+    """Bankroll sizing rules; scalars delegate to the vector helpers."""
+
+    @staticmethod
+    def calculate_kelly_criterion(win_probability: float, win_amount: float,
+                                  loss_amount: float) -> float:
+        return float(kelly_criterion_array(win_probability, win_amount, loss_amount))
+
+    @staticmethod
+    def calculate_optimal_stake(bankroll: float, win_probability: float,
+                                win_amount: float, loss_amount: float,
+                                kelly_fraction: float = 0.5) -> float:
+        return float(optimal_stake_array(bankroll, win_probability,
+                                         win_amount, loss_amount, kelly_fraction))
+
+    @staticmethod
+    def calculate_risk_of_ruin(bankroll: float, win_rate: float, std_dev: float,
+                               bet_size: float) -> float:
+        """Classic exponential risk-of-ruin for a given unit bet size."""
+        return float(risk_of_ruin_batch(bankroll, win_rate, std_dev, bet_size))
+
+
+class PokerMath:
+    """Stateless poker formulas; all methods are static dispatchers."""
+
+    @staticmethod
+    def calculate_pot_odds(pot: float, to_call: float) -> float:
+        return _pot_odds(pot, to_call)
+
+    @staticmethod
+    def calculate_implied_odds(pot: float, to_call: float,
+                               expected_future: float) -> float:
+        return _implied_odds(pot, to_call, expected_future)
+
+    @staticmethod
+    def calculate_expected_value(win_probability: float, pot: float,
+                                 to_call: float) -> float:
+        return _expected_value(win_probability, pot, to_call)
+
+    @staticmethod
+    def calculate_minimum_defense_frequency(bet: float, pot: float) -> float:
+        return _minimum_defense_frequency(bet, pot)
+
+    @staticmethod
+    def calculate_optimal_bet_size(pot: float, fold_target: float) -> float:
+        return _optimal_bet_size(pot, fold_target)
+
+    @staticmethod
+    def calculate_bluff_frequency(bet: float, pot: float) -> float:
+        return _bluff_frequency(bet, pot)
+
+    @staticmethod
+    def calculate_fold_equity(fold_probability: float, pot: float) -> float:
+        return _fold_equity(fold_probability, pot)
+
+    @staticmethod
+    def calculate_hand_combinations(hand_type: Union[HandStrength, str]) -> int:
+        """Distinct five-card combinations that make this hand category.
+
+        Accepts a HandStrength member or its lowercase name.
+        """
+        if not isinstance(hand_type, HandStrength):
+            hand_type = _HAND_NAMES[hand_type.lower()]
+        return _COMBINATIONS[hand_type.value]
+
+    @staticmethod
+    def calculate_outs(draw_type: str) -> int:
+        """Estimated outs for a named draw; 0 for unknown draws."""
+        return _OUT_ESTIMATES.get(draw_type, 0)
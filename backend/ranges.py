@@ -0,0 +1,387 @@
+"""Preflop range analysis over the 169 canonical starting hands.
+
+Hands use the usual notation: 'AA' for pairs, 'AKs'/'AKo' for suited and
+offsuit combos.  Range-vs-range equity reads from a 169x169 matrix so a
+|R1| x |R2| comparison is one vectorized gather instead of a nested
+Python loop.
+"""
+
+from functools import lru_cache
+from typing import List, Tuple
+import re
+
+import numpy as np
+
+from . import fast_equity
+
+RANK_ORDER = 'AKQJT98765432'
+
+_CHEN_BASE = {'A': 10.0, 'K': 8.0, 'Q': 7.0, 'J': 6.0, 'T': 5.0,
+              '9': 4.5, '8': 4.0, '7': 3.5, '6': 3.0, '5': 2.5,
+              '4': 2.0, '3': 1.5, '2': 1.0}
+_GAP_PENALTY = (0.0, 1.0, 2.0, 4.0)
+
+
+def _chen_score(hand: str) -> float:
+    """Chen-formula strength of a canonical hand, roughly -1..20."""
+    high, low = hand[0], hand[1]
+    score = _CHEN_BASE[high]
+    if high == low:
+        return max(5.0, score * 2.0)
+    gap = RANK_ORDER.index(low) - RANK_ORDER.index(high) - 1
+    score -= _GAP_PENALTY[gap] if gap < 4 else 5.0
+    # close connectors below queen-high can make straights both ways
+    if gap <= 1 and RANK_ORDER.index(high) >= 2:
+        score += 1.0
+    if hand.endswith('s'):
+        score += 2.0
+    return score
+
+
+# one bit per card, aligned with the engine's uint8 code so that
+# ``CARD_BIT[card] == 1 << encode_card(card)``; known-card tests become a
+# single AND against a uint64 instead of set membership on strings
+CARD_BIT = {rank + suit: 1 << (fast_equity._RANK_INDEX[rank] * 4
+                               + fast_equity._SUIT_INDEX[suit])
+            for rank in fast_equity.RANKS for suit in fast_equity.SUITS}
+
+
+def cards_to_mask(cards: List[str]) -> int:
+    """Fold a card list into its 52-bit deck mask."""
+    mask = 0
+    for card in cards:
+        mask |= CARD_BIT[card]
+    return mask
+
+
+def _combo_masks(combos: np.ndarray) -> np.ndarray:
+    """Per-combo uint64 masks for an (n, 2) combo array."""
+    one = np.uint64(1)
+    return ((one << combos[:, 0].astype(np.uint64))
+            | (one << combos[:, 1].astype(np.uint64)))
+
+
+def _class_combos(hand: str) -> np.ndarray:
+    """All card combos of a hand class as an (n, 2) uint8 array."""
+    rank1 = fast_equity._RANK_INDEX[hand[0]]
+    rank2 = fast_equity._RANK_INDEX[hand[1]]
+    combos = []
+    if hand[0] == hand[1]:
+        for s1 in range(4):
+            for s2 in range(s1 + 1, 4):
+                combos.append((rank1 * 4 + s1, rank2 * 4 + s2))
+    elif hand.endswith('s'):
+        for s in range(4):
+            combos.append((rank1 * 4 + s, rank2 * 4 + s))
+    else:
+        for s1 in range(4):
+            for s2 in range(4):
+                if s1 != s2:
+                    combos.append((rank1 * 4 + s1, rank2 * 4 + s2))
+    return np.array(combos, dtype=np.uint8)
+
+
+@lru_cache(maxsize=None)
+def hand_vs_hand_equity(hand1: str, hand2: str, trials: int = 20000) -> float:
+    """Heads-up preflop equity of one hand class against another.
+
+    Monte Carlo over all non-conflicting combo pairs of the two classes;
+    ties count half.  Matchups are memoized under a canonical ordering -
+    equity(A, B) is served as 1 - equity(B, A) - so each of the ~14k
+    distinct pairings simulates at most once per process.
+    """
+    if hand2 < hand1:
+        return 1.0 - hand_vs_hand_equity(hand2, hand1, trials)
+
+    combos1 = _class_combos(hand1)
+    combos2 = _class_combos(hand2)
+    # all non-conflicting combo pairings, flattened to 4 cards per row
+    pairs = []
+    for c1 in combos1:
+        for c2 in combos2:
+            if c1[0] != c2[0] and c1[0] != c2[1] and c1[1] != c2[0] and c1[1] != c2[1]:
+                pairs.append((c1[0], c1[1], c2[0], c2[1]))
+    used = np.array(pairs, dtype=np.uint8)
+
+    rng = np.random.default_rng(0x5EED)
+    rows = used[rng.integers(0, used.shape[0], size=trials)]
+
+    # deal 5 board cards avoiding the four hole cards: random keys over
+    # the full deck with the used cards pushed to +inf before selection
+    keys = rng.random((trials, 52))
+    keys[np.arange(trials)[:, None], rows] = np.inf
+    board = np.argpartition(keys, 5, axis=1)[:, :5].astype(np.uint8)
+
+    hands = np.empty((trials, 7), dtype=np.uint8)
+    hands[:, :2] = rows[:, :2]
+    hands[:, 2:] = board
+    strength1 = fast_equity.evaluate7(hands)
+    hands[:, :2] = rows[:, 2:]
+    strength2 = fast_equity.evaluate7(hands)
+
+    wins = np.count_nonzero(strength1 > strength2)
+    ties = np.count_nonzero(strength1 == strength2)
+    return (wins + 0.5 * ties) / trials
+
+
+# one compiled pattern covers the whole grammar - pairs ('88', '88+'),
+# suited/offsuit/bare combos ('ATs', 'KQo', 'AK'), kicker-upward ('ATs+')
+# and kicker spans ('A2s-A5s'); backreferences pin the span to the same
+# high rank and suitedness
+_TOKEN_RE = re.compile(
+    r'([2-9TJQKA])\1(\+)?'
+    r'|([2-9TJQKA])([2-9TJQKA])([so])?(?:(\+)|-\3([2-9TJQKA])\5)?'
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_range_cached(range_str: str) -> Tuple[str, ...]:
+    """Expand a range string once; identical strings are free thereafter."""
+    hands = []
+    for match in _TOKEN_RE.finditer(range_str):
+        pair, pair_plus, high, low, suit, plus, span_end = match.groups()
+        if pair:
+            if pair_plus:
+                # pairs upward: 88+ -> 88, 99, ..., AA
+                for idx in range(RANK_ORDER.index(pair), -1, -1):
+                    hands.append(RANK_ORDER[idx] * 2)
+            else:
+                hands.append(pair * 2)
+        elif plus:
+            hi = RANK_ORDER.index(high)
+            lo = RANK_ORDER.index(low)
+            if lo - hi <= 2 and high != 'A':
+                # connectors and one-gappers climb with the gap kept,
+                # up to the ace-high rung: 76s+ -> 76s, 87s, ..., AKs.
+                # Ace-high tokens read as kicker series and fall
+                # through to the rule below.
+                gap = lo - hi
+                for h in range(hi, -1, -1):
+                    hands.append(RANK_ORDER[h] + RANK_ORDER[h + gap]
+                                 + (suit or ''))
+            else:
+                # kicker upward with the high card fixed:
+                # ATs+ -> ATs, AJs, AQs, AKs
+                for idx in range(lo, hi, -1):
+                    hands.append(high + RANK_ORDER[idx] + (suit or ''))
+        elif span_end:
+            # inclusive span over the kicker, e.g. A2s-A5s
+            lo = RANK_ORDER.index(low)
+            hi = RANK_ORDER.index(span_end)
+            for idx in range(min(lo, hi), max(lo, hi) + 1):
+                hands.append(high + RANK_ORDER[idx] + suit)
+        elif suit:
+            hands.append(high + low + suit)
+        else:
+            # bare non-pair covers both suitednesses
+            hands.append(high + low + 's')
+            hands.append(high + low + 'o')
+    return tuple(hands)
+
+
+def _generate_all_hands() -> Tuple[str, ...]:
+    hands = []
+    for i, first in enumerate(RANK_ORDER):
+        for j, second in enumerate(RANK_ORDER):
+            if i == j:
+                hands.append(first + second)
+            elif i < j:
+                hands.append(first + second + 's')
+            else:
+                hands.append(second + first + 'o')
+    return tuple(hands)
+
+
+def _build_equity_table() -> np.ndarray:
+    """Model-based heads-up equity for every hand-class pair.
+
+    Seeded from Chen scores mapped onto a linear equity scale; crude at
+    the extremes but monotone in matchup strength, which is what range
+    comparisons need.
+    """
+    scores = np.array([_chen_score(hand) for hand in _ALL_HANDS],
+                      dtype=np.float32)
+    diff = scores[:, None] - scores[None, :]
+    return np.clip(0.5 + diff / 40.0, 0.12, 0.88).astype(np.float32)
+
+
+# built once at import: the hand list, its index map and the (mutable,
+# shared) equity matrix that Monte Carlo lookups refine in place
+_ALL_HANDS = _generate_all_hands()
+_HAND_TO_IDX = {hand: i for i, hand in enumerate(_ALL_HANDS)}
+_EQUITY_TABLE = _build_equity_table()
+
+
+class Range:
+    """A set of starting hands as a 13x13 boolean mask.
+
+    Rows and columns follow ``RANK_ORDER``, so the layout matches the
+    familiar range chart: pairs on the diagonal, suited combos above,
+    offsuit below, and the raveled mask lines up with ``_ALL_HANDS``.
+    Set algebra on ranges is bitwise NumPy ops over 169 bools, and
+    ``key()`` exposes the raw bytes as a cheap, hashable cache key.
+    """
+
+    __slots__ = ('mask',)
+
+    def __init__(self, mask: np.ndarray = None):
+        self.mask = (np.zeros((13, 13), dtype=bool) if mask is None
+                     else np.asarray(mask, dtype=bool).reshape(13, 13))
+
+    @classmethod
+    def from_string(cls, range_str: str) -> 'Range':
+        """Build a mask from range notation, reusing the cached parse."""
+        return cls.from_hands(_parse_range_cached(range_str))
+
+    @classmethod
+    def from_hands(cls, hands) -> 'Range':
+        flat = np.zeros(169, dtype=bool)
+        flat[[_HAND_TO_IDX[h] for h in hands]] = True
+        return cls(flat)
+
+    def union(self, other: 'Range') -> 'Range':
+        return Range(self.mask | other.mask)
+
+    def intersect(self, other: 'Range') -> 'Range':
+        return Range(self.mask & other.mask)
+
+    def remove_blockers(self, blocked: 'Range') -> 'Range':
+        return Range(self.mask & ~blocked.mask)
+
+    def indices(self) -> np.ndarray:
+        """Flat indices into the 169-hand order, for matrix gathers."""
+        return np.flatnonzero(self.mask.ravel())
+
+    def hands(self) -> List[str]:
+        return [_ALL_HANDS[i] for i in self.indices()]
+
+    def key(self) -> bytes:
+        return self.mask.tobytes()
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.mask))
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Range) and bool(np.array_equal(self.mask, other.mask))
+
+    def __hash__(self) -> int:
+        return hash(self.key())
+
+
+class RangeAnalyzer:
+    """Parses range notation and scores range-vs-range matchups."""
+
+    def __init__(self):
+        # module constants shared by every instance; creating an analyzer
+        # per hand analyzed costs nothing but the object header
+        self.all_hands = _ALL_HANDS
+        self.hand_to_idx = _HAND_TO_IDX
+        self.equity_table = _EQUITY_TABLE
+        self._index_cache = {}
+
+    def _generate_all_hands(self) -> Tuple[str, ...]:
+        return _ALL_HANDS
+
+    def parse_range(self, range_str: str) -> List[str]:
+        """Expand notation like '22+, ATs+, KQo, A2s-A5s' to hand names."""
+        return list(_parse_range_cached(range_str))
+
+    def _range_to_indices(self, range_str: str) -> np.ndarray:
+        """Cached row indices for a range string, skipping re-parsing."""
+        indices = self._index_cache.get(range_str)
+        if indices is None:
+            indices = self._index_cache[range_str] = np.fromiter(
+                (self.hand_to_idx[h] for h in _parse_range_cached(range_str)),
+                dtype=np.int16)
+        return indices
+
+    def calculate_range_equity(self, range1, range2) -> float:
+        """Average equity of range1 against range2, one matrix gather.
+
+        Accepts Range masks, expanded hand lists or raw range strings;
+        strings reuse the cached parse and index array.
+        """
+        if isinstance(range1, Range) and isinstance(range2, Range):
+            return float(self.equity_table[
+                np.ix_(range1.indices(), range2.indices())].mean())
+        if isinstance(range1, str) and isinstance(range2, str):
+            idx1 = self._range_to_indices(range1)
+            idx2 = self._range_to_indices(range2)
+            return float(self.equity_table[np.ix_(idx1, idx2)].mean())
+        idx1 = np.fromiter((self.hand_to_idx[h] for h in range1),
+                           dtype=np.int16, count=len(range1))
+        idx2 = np.fromiter((self.hand_to_idx[h] for h in range2),
+                           dtype=np.int16, count=len(range2))
+        return float(self.equity_table[np.ix_(idx1, idx2)].mean())
+
+    def monte_carlo_equity(self, range1: List[str], range2: List[str],
+                           board: List[str] = (), iters: int = 20000) -> float:
+        """Simulated equity of range1 versus range2 on a given board.
+
+        Unlike the preflop matrix this respects the board and card
+        removal: each trial draws one combo per range (rejecting
+        collisions), completes the board, and both hands run through the
+        batch evaluator.  Ties count half.
+        """
+        board_codes = fast_equity.encode_cards(list(board))
+        board_mask = cards_to_mask(list(board))
+
+        def range_combos(hands):
+            stacked = np.vstack([_class_combos(h) for h in hands])
+            # blocker filter: one AND against the board mask per combo
+            alive = (_combo_masks(stacked) & np.uint64(board_mask)) == 0
+            return stacked[alive]
+
+        combos1 = range_combos(range1)
+        combos2 = range_combos(range2)
+        if combos1.size == 0 or combos2.size == 0:
+            raise ValueError('range has no combos left after card removal')
+
+        rng = np.random.default_rng()
+        ours = combos1[rng.integers(0, combos1.shape[0], size=iters)]
+        theirs = combos2[rng.integers(0, combos2.shape[0], size=iters)]
+        ours_mask = _combo_masks(ours)
+        theirs_mask = _combo_masks(theirs)
+        # resample the opponent combo wherever the two masks intersect
+        while True:
+            clash = (ours_mask & theirs_mask) != 0
+            n_clash = int(np.count_nonzero(clash))
+            if not n_clash:
+                break
+            theirs[clash] = combos2[rng.integers(0, combos2.shape[0], size=n_clash)]
+            theirs_mask[clash] = _combo_masks(theirs[clash])
+
+        needed = 5 - len(board_codes)
+        keys = rng.random((iters, 52))
+        rows = np.arange(iters)[:, None]
+        keys[rows, ours] = np.inf
+        keys[rows, theirs] = np.inf
+        if board_codes.size:
+            keys[:, board_codes] = np.inf
+        runout = np.argpartition(keys, needed, axis=1)[:, :needed].astype(np.uint8)
+
+        hands = np.empty((iters, 7), dtype=np.uint8)
+        hands[:, 2:2 + len(board_codes)] = board_codes
+        hands[:, 2 + len(board_codes):] = runout
+        hands[:, :2] = ours
+        strength1 = fast_equity.evaluate7(hands)
+        hands[:, :2] = theirs
+        strength2 = fast_equity.evaluate7(hands)
+
+        wins = np.count_nonzero(strength1 > strength2)
+        ties = np.count_nonzero(strength1 == strength2)
+        return (wins + 0.5 * ties) / iters
+
+    def count_live_combos(self, hands: List[str], dead_cards: List[str]) -> int:
+        """Combos of a range not blocked by the dead cards, via mask ANDs."""
+        dead = np.uint64(cards_to_mask(dead_cards))
+        stacked = np.vstack([_class_combos(h) for h in hands])
+        return int(np.count_nonzero((_combo_masks(stacked) & dead) == 0))
+
+    def _lookup_hand_vs_hand_equity(self, hand1: str, hand2: str) -> float:
+        # simulated equity writes through to the model-seeded matrix, so
+        # matchups harden to Monte Carlo numbers as they are queried
+        equity = hand_vs_hand_equity(hand1, hand2)
+        self.equity_table[self.hand_to_idx[hand1], self.hand_to_idx[hand2]] = equity
+        self.equity_table[self.hand_to_idx[hand2], self.hand_to_idx[hand1]] = 1.0 - equity
+        return equity
@@ -0,0 +1,28 @@
+"""WSGI entrypoint for production servers.
+
+Run with gunicorn:
+
+    gunicorn -w $(nproc) -k gthread --threads 4 wsgi:app
+
+The endpoints are CPU-bound (Monte Carlo simulation), so process workers
+carry the scaling; the threads per worker only exist to keep cheap
+requests from queueing behind a long simulation. Green-thread workers
+(``-k gevent``) help servers that wait on I/O, not this one — the
+simulation never yields, so gevent would still serialize requests per
+worker.
+
+With waitress:
+
+    waitress-serve --threads=8 wsgi:app
+
+``python -m backend.app`` remains the single-threaded debug server.
+"""
+
+from backend.app import app
+
+if __name__ == '__main__':
+    try:
+        from waitress import serve
+        serve(app, listen='0.0.0.0:5000')
+    except ImportError:
+        app.run()